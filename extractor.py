@@ -1,6 +1,8 @@
 """Neural OCR extraction logic for real estate and government documents."""
 
 import json
+from collections.abc import Sequence
+from functools import lru_cache
 
 from openai import OpenAI
 
@@ -88,35 +90,72 @@ Rules:
 - Do NOT make up or infer values that are not explicitly stated.
 """
 
+# Page images are sent inline as data URIs
+_PNG_URI_PREFIX = "data:image/png;base64,"
+
 # Used to get raw text from images for PII scanning
 OCR_SYSTEM_PROMPT = """You are an OCR engine. Extract ALL text from this document image exactly as it appears, preserving line breaks and formatting. Return ONLY the raw text, nothing else. Include every character, number, and symbol visible on the page."""
 
 
+def page_image_content(images_b64: Sequence[str]) -> tuple[dict, ...]:
+    """Build the per-page label + image message parts for a document.
+
+    Extraction, verification and the OCR pass send the same pages; callers
+    build the parts once per run and pass them to each pass as
+    page_content. Passes copy into a list before appending their own
+    instructions, so the shared dicts are never mutated.
+
+    Args:
+        images_b64: Base64-encoded PNG strings, one per page.
+
+    Returns:
+        Alternating text / image_url content parts, two per page.
+    """
+    page_count = len(images_b64)
+    content: list[dict] = []
+    for i, img_b64 in enumerate(images_b64):
+        content.append({"type": "text", "text": f"--- Page {i + 1} of {page_count} ---"})
+        content.append({
+            "type": "image_url",
+            "image_url": {"url": _PNG_URI_PREFIX + img_b64, "detail": "high"},
+        })
+    return tuple(content)
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """Process-wide OpenAI client, built on first use.
+
+    Sharing one client keeps its HTTP connection pool warm across calls;
+    building it lazily means importing this module never needs an API key.
+    """
+    return OpenAI()
+
+
 def extract_from_images(
     images_b64: list[str],
     mode: str,
-    client: OpenAI,
+    client: OpenAI | None = None,
+    page_content: tuple[dict, ...] | None = None,
 ) -> dict:
     """Send document page images to GPT-4o Vision and get structured extraction.
 
     Args:
         images_b64: List of base64-encoded PNG strings, one per page.
         mode: 'real_estate' or 'gov'.
-        client: OpenAI client instance.
+        client: OpenAI client instance. Defaults to the shared client.
+        page_content: Parts from page_image_content(images_b64), if the
+            caller already built them.
 
     Returns:
         Parsed JSON dict matching the target schema.
     """
+    client = client or get_openai_client()
     system_prompt = REAL_ESTATE_SYSTEM_PROMPT if mode == "real_estate" else GOV_SYSTEM_PROMPT
 
-    content: list[dict] = []
-    for i, img_b64 in enumerate(images_b64):
-        content.append({"type": "text", "text": f"--- Page {i + 1} of {len(images_b64)} ---"})
-        content.append({
-            "type": "image_url",
-            "image_url": {"url": f"data:image/png;base64,{img_b64}", "detail": "high"},
-        })
-
+    if page_content is None:
+        page_content = page_image_content(images_b64)
+    content = list(page_content)
     content.append({
         "type": "text",
         "text": "Extract all data from the above document pages into the JSON schema specified. Return ONLY valid JSON.",
@@ -136,25 +175,34 @@ def extract_from_images(
     return json.loads(response.choices[0].message.content)
 
 
-def extract_raw_text(images_b64: list[str], client: OpenAI) -> list[str]:
+def extract_raw_text(
+    images_b64: list[str],
+    client: OpenAI | None = None,
+    page_content: tuple[dict, ...] | None = None,
+) -> list[str]:
     """Extract raw text from document images for PII scanning.
 
     Args:
         images_b64: List of base64-encoded PNG strings.
-        client: OpenAI client instance.
+        client: OpenAI client instance. Defaults to the shared client.
+        page_content: Parts from page_image_content(images_b64), if the
+            caller already built them.
 
     Returns:
         List of text strings, one per page.
     """
+    client = client or get_openai_client()
     page_texts: list[str] = []
 
-    for i, img_b64 in enumerate(images_b64):
+    if page_content is None:
+        page_content = page_image_content(images_b64)
+    # Only the image parts; each page gets its own OCR prompt
+    image_parts = page_content[1::2]
+
+    for i, image_part in enumerate(image_parts):
         content = [
             {"type": "text", "text": f"Extract all text from page {i + 1}:"},
-            {
-                "type": "image_url",
-                "image_url": {"url": f"data:image/png;base64,{img_b64}", "detail": "high"},
-            },
+            image_part,
         ]
 
         response = client.chat.completions.create(
@@ -2,7 +2,10 @@
 
 import base64
 import io
+import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PIL import Image
@@ -25,12 +28,18 @@ def check_poppler_installed() -> bool:
         return False
 
 
-def pdf_to_images(pdf_path: str, dpi: int = 200) -> list[Image.Image]:
+def pdf_to_images(
+    pdf_path: str,
+    dpi: int = 200,
+    thread_count: int | None = None,
+) -> list[Image.Image]:
     """Convert a PDF file to a list of PIL Images, one per page.
 
     Args:
         pdf_path: Path to the PDF file.
         dpi: Resolution for rendering. 200 is a good balance of quality and token cost.
+        thread_count: pdftoppm processes to split the pages across.
+            Defaults to one less than the number of CPUs.
 
     Returns:
         List of PIL Image objects.
@@ -45,7 +54,17 @@ def pdf_to_images(pdf_path: str, dpi: int = 200) -> list[Image.Image]:
     if not path.suffix.lower() == ".pdf":
         raise ValueError(f"Expected a PDF file, got: {path.suffix}")
 
-    images = convert_from_path(str(path), dpi=dpi)
+    if thread_count is None:
+        thread_count = max(1, (os.cpu_count() or 2) - 1)
+
+    # pdf2image only parallelizes when rendering to files; load each page
+    # into memory (which also closes its file) before the folder goes away
+    with tempfile.TemporaryDirectory(prefix="docextract-") as output_folder:
+        images = convert_from_path(
+            str(path), dpi=dpi, thread_count=thread_count, output_folder=output_folder,
+        )
+        for image in images:
+            image.load()
     return images
 
 
@@ -69,6 +88,52 @@ def image_to_base64(image: Image.Image, max_size: tuple[int, int] = (2048, 2048)
     return base64.b64encode(buffer.getvalue()).decode("utf-8")
 
 
+def images_to_base64(images: list[Image.Image], max_workers: int = 8) -> list[str]:
+    """Encode several pages with image_to_base64, in page order.
+
+    Pillow releases the GIL while resizing and PNG-encoding, so pages are
+    encoded on a small thread pool rather than one after another.
+
+    Args:
+        images: PIL Images, one per page.
+        max_workers: Upper bound on encoder threads.
+
+    Returns:
+        Base64-encoded PNG strings in the same order as images.
+    """
+    workers = min(len(images), max_workers)
+    if workers <= 1:
+        return [image_to_base64(img) for img in images]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(image_to_base64, images))
+
+
+def pdf_to_base64_images(
+    pdf_path: str,
+    dpi: int = 200,
+    thread_count: int | None = None,
+) -> list[str]:
+    """Render a PDF and encode every page with image_to_base64.
+
+    Returns only strings, so it can run in a worker process without
+    pickling PIL images back to the caller.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        dpi: Resolution for rendering.
+        thread_count: CPU budget for this call, used for both the pdftoppm
+            processes and the encoder threads. Defaults to pdf_to_images'
+            and images_to_base64's own defaults.
+
+    Returns:
+        Base64-encoded PNG strings, one per page.
+    """
+    images = pdf_to_images(pdf_path, dpi=dpi, thread_count=thread_count)
+    if thread_count is None:
+        return images_to_base64(images)
+    return images_to_base64(images, max_workers=thread_count)
+
+
 def get_pdf_info(pdf_path: str) -> dict:
     """Get basic info about a PDF file.
 
@@ -4,22 +4,22 @@ import re
 
 from schemas import PIIFinding, PIIType, PIISeverity, PIIReport
 
-# Regex patterns for PII detection
+# Regex patterns for PII detection, compiled once at import
 PII_PATTERNS: dict[PIIType, dict] = {
     PIIType.SSN: {
-        "pattern": r"\b\d{3}-\d{2}-\d{4}\b",
+        "pattern": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
         "severity": PIISeverity.HIGH,
         "redact": lambda m: f"***-**-{m.group(0)[-4:]}",
         "recommendation": "CRITICAL: SSN detected. Encrypt before transmission. Verify if SSN is required for this request.",
     },
     PIIType.PHONE: {
-        "pattern": r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b",
+        "pattern": re.compile(r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"),
         "severity": PIISeverity.MEDIUM,
         "redact": lambda m: f"(***) ***-{m.group(0)[-4:]}",
         "recommendation": "Phone number detected. Required for FOIA contact. Ensure secure transmission channel.",
     },
     PIIType.EMAIL: {
-        "pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",
+        "pattern": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
         "severity": PIISeverity.MEDIUM,
         "redact": lambda m: f"{m.group(0)[0]}***@{m.group(0).split('@')[1]}",
         "recommendation": "Email address detected. Required for FOIA correspondence. Standard handling applies.",
@@ -40,9 +40,9 @@ def scan_text_for_pii(text: str, page_number: int) -> list[PIIFinding]:
     findings: list[PIIFinding] = []
 
     for pii_type, config in PII_PATTERNS.items():
-        for match in re.finditer(config["pattern"], text):
-            # Calculate approximate line number
-            line_num = text[: match.start()].count("\n") + 1
+        for match in config["pattern"].finditer(text):
+            # Calculate approximate line number (count in place, no slice copy)
+            line_num = text.count("\n", 0, match.start()) + 1
 
             findings.append(
                 PIIFinding(
@@ -73,4 +73,5 @@ def scan_all_pages(page_texts: list[str]) -> PIIReport:
         page_findings = scan_text_for_pii(text, page_number=i + 1)
         all_findings.extend(page_findings)
 
-    return PIIReport(findings=all_findings)
+    # Findings were validated as they were built — assemble without re-checking
+    return PIIReport.model_construct(findings=tuple(all_findings))
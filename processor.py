@@ -14,7 +14,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from dotenv import load_dotenv
-from openai import OpenAI
 from pydantic import ValidationError
 
 from schemas import (
@@ -26,10 +25,15 @@ from schemas import (
 from pdf_converter import (
     check_poppler_installed,
     get_pdf_info,
-    image_to_base64,
+    images_to_base64,
     pdf_to_images,
 )
-from extractor import extract_from_images, extract_raw_text
+from extractor import (
+    extract_from_images,
+    extract_raw_text,
+    get_openai_client,
+    page_image_content,
+)
 from verifier import compute_overall_confidence, verify_extraction
 from pii_scanner import scan_all_pages
 from terminal_ui import (
@@ -161,7 +165,8 @@ def main():
 
     with console.status("[bold green]Converting PDF pages...", spinner="dots"):
         images = pdf_to_images(str(input_path))
-        images_b64 = [image_to_base64(img) for img in images]
+        images_b64 = images_to_base64(images)
+        page_content = page_image_content(images_b64)
 
     console.print(f"  [green]\u2713[/] Converted {len(images)} page(s) to images")
 
@@ -174,10 +179,10 @@ def main():
         f"Analyzing {len(images)} page(s) with neural OCR for structured extraction...",
     )
 
-    client = OpenAI()
+    client = get_openai_client()
 
     with console.status("[bold green]Running neural OCR extraction...", spinner="dots"):
-        raw_extraction = extract_from_images(images_b64, args.mode, client)
+        raw_extraction = extract_from_images(images_b64, args.mode, client, page_content)
 
     if args.verbose:
         console.print("\n[dim]Raw API response:[/]")
@@ -226,7 +231,7 @@ def main():
         )
 
         with console.status("[bold green]Verifying extraction sources...", spinner="dots"):
-            citations = verify_extraction(images_b64, validated_data, client)
+            citations = verify_extraction(images_b64, validated_data, client, page_content)
 
         overall_confidence = compute_overall_confidence(citations)
 
@@ -246,7 +251,7 @@ def main():
         )
 
         with console.status("[bold green]Extracting text for PII analysis...", spinner="dots"):
-            page_texts = extract_raw_text(images_b64, client)
+            page_texts = extract_raw_text(images_b64, client, page_content)
 
         pii_report = scan_all_pages(page_texts)
 
@@ -263,7 +268,7 @@ def main():
     if args.mode == "real_estate" and not validation_errors:
         dotloop_api_payload = validated.to_dotloop_api_format()
 
-    result = ExtractionResult(
+    result = ExtractionResult.build_trusted(
         mode=args.mode,
         source_file=str(input_path),
         extraction_timestamp=datetime.now(timezone.utc).isoformat(),
@@ -271,17 +276,18 @@ def main():
         dotloop_data=validated if args.mode == "real_estate" and not validation_errors else None,
         foia_data=validated if args.mode == "gov" and not validation_errors else None,
         dotloop_api_payload=dotloop_api_payload,
-        citations=citations,
+        citations=tuple(citations),
         overall_confidence=overall_confidence,
         pii_report=pii_report,
     )
 
-    # Write output
+    # Write output — serialize once and reuse the same JSON for display
+    result_json = result.model_dump_json(indent=2)
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(output_path).write_text(result.model_dump_json(indent=2))
+    Path(output_path).write_text(result_json)
 
     # Display output
-    show_json_output(result.model_dump(), output_path)
+    show_json_output(result_json, output_path)
 
     # Final summary
     field_count = count_fields(validated_data) if validated_data else 0
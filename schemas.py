@@ -1,7 +1,13 @@
-"""Pydantic models for document extraction — Dotloop, FOIA, PII, and Verification schemas."""
+"""Pydantic models for document extraction — Dotloop, FOIA, PII, and Verification schemas.
 
-from pydantic import BaseModel, Field, computed_field
-from typing import Optional, List
+Validators and serializers are built on first use rather than at import, so
+entry points that never touch a model don't pay for its core schema.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from typing import Dict, Literal, Optional, List, Tuple, get_args
+# pydantic needs typing_extensions' TypedDict before Python 3.12
+from typing_extensions import TypedDict
 from enum import Enum
 
 
@@ -9,6 +15,10 @@ from enum import Enum
 # Enums
 # =============================================================================
 
+ExtractionMode = Literal["real_estate", "gov"]
+EXTRACTION_MODES: frozenset[str] = frozenset(get_args(ExtractionMode))
+
+
 class ParticipantRole(str, Enum):
     BUYER = "BUYER"
     SELLER = "SELLER"
@@ -36,11 +46,20 @@ class PIISeverity(str, Enum):
     LOW = "LOW"
 
 
+# =============================================================================
+# Base Model
+# =============================================================================
+
+class _SchemaModel(BaseModel):
+    """Base for all extraction schemas — defers pydantic-core schema builds."""
+    model_config = ConfigDict(defer_build=True)
+
+
 # =============================================================================
 # Dotloop-Compatible Models (Real Estate)
 # =============================================================================
 
-class DotloopPropertyAddress(BaseModel):
+class DotloopPropertyAddress(_SchemaModel):
     """Maps to Dotloop Loop Details -> 'Property Address' section."""
     street_number: str = Field(description="Street number (e.g., '2100')")
     street_name: str = Field(description="Street name (e.g., 'Waterview Dr')")
@@ -54,7 +73,7 @@ class DotloopPropertyAddress(BaseModel):
     parcel_tax_id: Optional[str] = Field(default=None, description="Parcel/Tax ID")
 
 
-class DotloopFinancials(BaseModel):
+class DotloopFinancials(_SchemaModel):
     """Maps to Dotloop Loop Details -> 'Financials' section."""
     purchase_price: float = Field(description="Purchase/sale price in USD")
     earnest_money_amount: Optional[float] = Field(default=None, description="Earnest money deposit in USD")
@@ -63,7 +82,7 @@ class DotloopFinancials(BaseModel):
     sale_commission_total: Optional[float] = Field(default=None, description="Total commission in USD")
 
 
-class DotloopParticipant(BaseModel):
+class DotloopParticipant(_SchemaModel):
     """Maps to Dotloop Loop Participant."""
     full_name: str = Field(description="Full legal name")
     role: ParticipantRole = Field(description="Dotloop participant role")
@@ -72,7 +91,7 @@ class DotloopParticipant(BaseModel):
     company_name: Optional[str] = Field(default=None)
 
 
-class DotloopContractDates(BaseModel):
+class DotloopContractDates(_SchemaModel):
     """Maps to Dotloop Loop Details -> 'Contract Dates' section."""
     contract_agreement_date: Optional[str] = Field(default=None, description="Date contract was agreed upon")
     closing_date: Optional[str] = Field(default=None, description="Anticipated closing date")
@@ -81,7 +100,16 @@ class DotloopContractDates(BaseModel):
     inspection_date: Optional[str] = Field(default=None, description="Inspection deadline")
 
 
-class DotloopLoopDetails(BaseModel):
+class DotloopAPIPayload(TypedDict):
+    """Shape of DotloopLoopDetails.to_dotloop_api_format() output."""
+    name: str
+    transactionType: str
+    status: str
+    loopDetails: Dict[str, Dict[str, str]]
+    participants: List[Dict[str, str]]
+
+
+class DotloopLoopDetails(_SchemaModel):
     """Complete Dotloop Loop Details — the final output for real_estate mode.
 
     Matches Dotloop's sections-based API structure.
@@ -94,7 +122,7 @@ class DotloopLoopDetails(BaseModel):
     contract_dates: DotloopContractDates
     participants: List[DotloopParticipant]
 
-    def to_dotloop_api_format(self) -> dict:
+    def to_dotloop_api_format(self) -> DotloopAPIPayload:
         """Serialize to Dotloop's actual API section format.
 
         Field keys match dotloop_mapping.py from the doc_intel project.
@@ -143,46 +171,16 @@ class DotloopLoopDetails(BaseModel):
             ],
         }
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "loop_name": "Michael B. Curtis, 2100 Waterview Dr, Billings, MT 59101",
-                    "transaction_type": "PURCHASE_OFFER",
-                    "transaction_status": "PRE_OFFER",
-                    "property_address": {
-                        "street_number": "2100",
-                        "street_name": "Waterview Dr",
-                        "unit_number": "B",
-                        "city": "Billings",
-                        "state_or_province": "MT",
-                        "postal_code": "59101",
-                        "country": "US",
-                    },
-                    "financials": {
-                        "purchase_price": 485000.00,
-                        "earnest_money_amount": 10000.00,
-                        "earnest_money_held_by": "First American Title",
-                    },
-                    "contract_dates": {
-                        "closing_date": "03/15/2025",
-                        "offer_date": "01/28/2025",
-                    },
-                    "participants": [
-                        {"full_name": "Michael B. Curtis", "role": "BUYER"},
-                        {"full_name": "Tiffany J. Selong", "role": "SELLER"},
-                    ],
-                }
-            ]
-        }
-    }
-
 
 # =============================================================================
 # FOIA.gov v1.1.0 Models (Government)
 # =============================================================================
 
-class FOIARequesterInfo(BaseModel):
+FOIACategory = Literal["commercial", "educational", "media", "other"]
+FOIA_CATEGORIES: frozenset[str] = frozenset(get_args(FOIACategory))
+
+
+class FOIARequesterInfo(_SchemaModel):
     """Requester information matching FOIA.gov API Spec v1.1.0 field names."""
     first_name: str = Field(description="Requester first name")
     last_name: str = Field(description="Requester last name")
@@ -195,11 +193,11 @@ class FOIARequesterInfo(BaseModel):
     organization: Optional[str] = Field(default=None, description="Organization or company affiliation")
 
 
-class FOIARequest(BaseModel):
+class FOIARequest(_SchemaModel):
     """FOIA request data matching FOIA.gov API Spec v1.1.0."""
     requester: FOIARequesterInfo = Field(description="Requester contact information")
     request_description: str = Field(description="Description of records being requested")
-    request_category: Optional[str] = Field(
+    request_category: Optional[FOIACategory] = Field(
         default=None,
         description="Category: commercial, educational, media, other",
     )
@@ -211,40 +209,23 @@ class FOIARequest(BaseModel):
     date_range_start: Optional[str] = Field(default=None, description="Start of requested date range")
     date_range_end: Optional[str] = Field(default=None, description="End of requested date range")
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "requester": {
-                        "first_name": "Sarah",
-                        "last_name": "Mitchell",
-                        "email": "s.mitchell@springfield-news.org",
-                        "phone": "(217) 555-0134",
-                        "address_street": "742 Evergreen Terrace",
-                        "address_city": "Springfield",
-                        "address_state": "IL",
-                        "address_zip": "62704",
-                        "organization": "Springfield Daily Register",
-                    },
-                    "request_description": "All records related to border technology procurement contracts",
-                    "request_category": "media",
-                    "agency": "Department of Homeland Security",
-                    "agency_component_name": "Office of Privacy",
-                    "fee_waiver": True,
-                    "expedited_processing": True,
-                    "date_range_start": "01/01/2023",
-                    "date_range_end": "12/31/2024",
-                }
-            ]
-        }
-    }
+    @field_validator("request_category", mode="before")
+    @classmethod
+    def _normalize_category(cls, value):
+        """Accept model output like 'Media ' and map unknown categories to 'other'."""
+        if not isinstance(value, str):
+            return value
+        value = value.strip().lower()
+        if not value:
+            return None
+        return value if value in FOIA_CATEGORIES else "other"
 
 
 # =============================================================================
 # PII Detection Models
 # =============================================================================
 
-class PIIFinding(BaseModel):
+class PIIFinding(_SchemaModel):
     """Individual PII detection result."""
     pii_type: PIIType = Field(description="Type of PII detected")
     value_redacted: str = Field(description="Redacted value (e.g., '***-**-1234')")
@@ -254,9 +235,22 @@ class PIIFinding(BaseModel):
     recommendation: str = Field(description="Handling recommendation")
 
 
-class PIIReport(BaseModel):
-    """Aggregated PII detection report with risk score."""
-    findings: List[PIIFinding] = Field(default_factory=list)
+# Risk-score weight per PII type; anything unlisted counts as _PII_DEFAULT_WEIGHT.
+_PII_WEIGHTS: dict[PIIType, int] = {PIIType.SSN: 40, PIIType.PHONE: 15, PIIType.EMAIL: 10}
+_PII_DEFAULT_WEIGHT = 5
+# Indexed by how many thresholds (25, 60) the score reaches
+_RISK_LEVELS = (PIISeverity.LOW, PIISeverity.MEDIUM, PIISeverity.HIGH)
+
+
+class PIIReport(_SchemaModel):
+    """Aggregated PII detection report with risk score.
+
+    Frozen; the score and level are derived from findings on every access,
+    so copies made with model_copy(update=...) never carry stale values.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    findings: Tuple[PIIFinding, ...] = ()
 
     @computed_field
     @property
@@ -265,26 +259,34 @@ class PIIReport(BaseModel):
 
         Weights: SSN=40, PHONE=15, EMAIL=10. Capped at 100.
         """
-        weights = {PIIType.SSN: 40, PIIType.PHONE: 15, PIIType.EMAIL: 10}
-        score = sum(weights.get(f.pii_type, 5) for f in self.findings)
-        return min(score, 100)
+        weight = _PII_WEIGHTS.get
+        default = _PII_DEFAULT_WEIGHT
+        score = 0
+        for f in self.findings:
+            score += weight(f.pii_type, default)
+            if score >= 100:
+                return 100
+        return score
 
     @computed_field
     @property
     def risk_level(self) -> PIISeverity:
-        if self.pii_risk_score >= 60:
-            return PIISeverity.HIGH
-        elif self.pii_risk_score >= 25:
-            return PIISeverity.MEDIUM
-        return PIISeverity.LOW
+        score = self.pii_risk_score
+        return _RISK_LEVELS[(score >= 25) + (score >= 60)]
 
 
 # =============================================================================
 # Verification / Citation Models
 # =============================================================================
 
-class VerificationCitation(BaseModel):
-    """Citation proving where an extracted value was found in the source document."""
+class VerificationCitation(_SchemaModel):
+    """Citation proving where an extracted value was found in the source document.
+
+    Frozen: one list of citations is shared by the SSE event, the result and
+    the confidence average, so no consumer may edit it in place.
+    """
+    model_config = ConfigDict(frozen=True)
+
     field_name: str = Field(description="Schema field this cites")
     extracted_value: str = Field(description="The value that was extracted")
     page_number: int = Field(description="Page number where value appears")
@@ -297,9 +299,9 @@ class VerificationCitation(BaseModel):
 # Top-Level Extraction Result
 # =============================================================================
 
-class ExtractionResult(BaseModel):
+class ExtractionResult(_SchemaModel):
     """Top-level wrapper for all extraction output."""
-    mode: str = Field(description="'real_estate' or 'gov'")
+    mode: ExtractionMode = Field(description="'real_estate' or 'gov'")
     source_file: str = Field(description="Input file path")
     extraction_timestamp: str = Field(description="ISO 8601 timestamp")
     model_used: str = Field(default="docextract-vision-v1")
@@ -310,11 +312,28 @@ class ExtractionResult(BaseModel):
     foia_data: Optional[FOIARequest] = None
 
     # Dotloop API-ready format (populated for real_estate mode)
-    dotloop_api_payload: Optional[dict] = None
+    dotloop_api_payload: Optional[DotloopAPIPayload] = None
 
     # Verification
-    citations: List[VerificationCitation] = Field(default_factory=list)
+    citations: Tuple[VerificationCitation, ...] = ()
     overall_confidence: float = Field(ge=0.0, le=1.0, default=0.0)
 
     # PII (gov mode only)
     pii_report: Optional[PIIReport] = None
+
+    @classmethod
+    def build_trusted(cls, **data) -> "ExtractionResult":
+        """Assemble a result from already-validated pipeline output.
+
+        Skips pydantic validation — nested models and citations are stored
+        as-is. Only the header fields are sanity-checked. Use the regular
+        constructor for anything that did not come out of the pipeline.
+        """
+        mode = data.get("mode")
+        if not isinstance(mode, str) or mode not in EXTRACTION_MODES:
+            raise ValueError(f"mode must be one of {sorted(EXTRACTION_MODES)}")
+        if not isinstance(data.get("source_file"), str):
+            raise TypeError("source_file must be a str")
+        if not isinstance(data.get("pages_processed"), int):
+            raise TypeError("pages_processed must be an int")
+        return cls.model_construct(**data)
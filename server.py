@@ -1,44 +1,164 @@
 #!/usr/bin/env python3
 """FastAPI server wrapping the DocExtract pipeline with SSE streaming."""
 
-import json
+import os
 import asyncio
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import AsyncGenerator
+from urllib.parse import quote
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse
-from openai import OpenAI
-from pydantic import BaseModel, ValidationError
-
-from pdf_converter import get_pdf_info, pdf_to_images, image_to_base64
-from extractor import extract_from_images, extract_raw_text
-from verifier import verify_extraction, compute_overall_confidence
+from fastapi.responses import StreamingResponse, FileResponse, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from pdf_converter import get_pdf_info, pdf_to_base64_images
+from extractor import (
+    extract_from_images,
+    extract_raw_text,
+    get_openai_client,
+    page_image_content,
+)
+from verifier import compute_overall_confidence, dump_citations, verify_extraction
 from pii_scanner import scan_all_pages
 from schemas import (
+    EXTRACTION_MODES,
     DotloopLoopDetails,
     ExtractionResult,
     FOIARequest,
+    PIIFinding,
+    PIIReport,
+    VerificationCitation,
 )
 
 load_dotenv()
 
-app = FastAPI(title="DocExtract API", version="1.0.0")
+# Every blocking step (pdfinfo, rendering, OpenAI calls) goes through
+# run_in_thread; the stock min(32, cpu + 4) pool queues those once a
+# few extraction streams overlap.
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", "64"))
+
+# Page decoding and PNG encoding are CPU-bound; run them in worker processes
+# so they don't contend for the GIL with the request threads. Each worker
+# holds a document's decoded pages, so keep the pool small by default.
+PDF_PROCESS_WORKERS = int(os.getenv("PDF_PROCESS_WORKERS", str(min(os.cpu_count() or 1, 4))))
+
+# Split the CPUs between the pool workers: each one renders with this many
+# pdftoppm processes and encodes with as many threads
+PDF_RENDER_THREADS = max(1, (os.cpu_count() or 1) // max(1, PDF_PROCESS_WORKERS))
+
+# Created by the lifespan handler; None means CPU work falls back to threads
+_PDF_POOL: ProcessPoolExecutor | None = None
+
+# Caps OpenAI vision calls in flight across all streams in this process, so a
+# burst of extractions queues here instead of piling into API rate limits
+OCR_CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", "4"))
+
+# Created by the lifespan handler; None means OpenAI calls run uncapped
+_OCR_SLOTS: asyncio.Semaphore | None = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _PDF_POOL, _OCR_SLOTS
+    executor = ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="docextract")
+    asyncio.get_running_loop().set_default_executor(executor)
+    _PDF_POOL = ProcessPoolExecutor(
+        max_workers=PDF_PROCESS_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    _OCR_SLOTS = asyncio.Semaphore(OCR_CONCURRENCY)
+    yield
+    _OCR_SLOTS = None
+    _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+    _PDF_POOL = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(title="DocExtract API", version="1.0.0", lifespan=lifespan)
+
+
+async def run_in_thread(func, *args):
+    """Run a blocking call on the default executor.
+
+    Like asyncio.to_thread, minus the contextvars copy and partial wrapper
+    per call — none of the pipeline functions read context variables.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def run_in_process(func, *args):
+    """Run CPU-bound work on the PDF process pool (threads if it isn't running)."""
+    return await asyncio.get_running_loop().run_in_executor(_PDF_POOL, func, *args)
+
+
+async def run_ocr_call(func, *args):
+    """run_in_thread for an OpenAI call, once a slot under OCR_CONCURRENCY frees up.
+
+    The slot is held until the executor thread finishes, not just until the
+    caller stops waiting: a client disconnect cancels the awaiting task, but
+    the OpenAI call itself keeps running and still counts against the cap.
+    """
+    slots = _OCR_SLOTS
+    if slots is None:
+        return await run_in_thread(func, *args)
+    await slots.acquire()
+    try:
+        future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.shield(future)
+
+
+# Comma-separated list of origins allowed to call the API (Vite dev server by default)
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("FRONTEND_URL", "http://localhost:5173").split(",")
+    if origin.strip()
+]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # let browsers cache preflight for a day
 )
 
 TEST_DOCS_DIR = Path(__file__).parent / "test_docs"
 DIST_DIR = Path(__file__).parent / "dist"
 
+# When deployed behind nginx, set this to an `internal` location aliased to
+# test_docs/ (e.g. "/protected-docs/") and nginx sends the PDF bytes itself
+DOCS_ACCEL_REDIRECT_PREFIX = os.getenv("DOCS_ACCEL_REDIRECT_PREFIX", "")
+
+# Schemas defer their pydantic-core build; pay it at startup rather than
+# on the first extraction request.
+for _model in (
+    DotloopLoopDetails,
+    FOIARequest,
+    PIIFinding,
+    PIIReport,
+    VerificationCitation,
+    ExtractionResult,
+):
+    _model.model_rebuild()
+del _model
+
+# Dump whole finding sequences in one serializer call
+_PII_FINDINGS_ADAPTER = TypeAdapter(tuple[PIIFinding, ...])
+
 
 # ---------------------------------------------------------------------------
 # Request / response models
@@ -55,13 +175,123 @@ class DocumentInfo(BaseModel):
     pages: int
 
 
+# ---------------------------------------------------------------------------
+# Serialization helpers
+# ---------------------------------------------------------------------------
+
+def dump_with(model: BaseModel, **dumped) -> dict:
+    """model_dump(mode="json") that reuses sub-payloads the caller already dumped.
+
+    Fields passed in `dumped` are excluded from the pydantic walk and spliced
+    back in, so the result keeps the model's field order (computed fields last).
+    """
+    rest = model.model_dump(mode="json", exclude=set(dumped))
+    cls = type(model)
+    return {
+        name: dumped[name] if name in dumped else rest[name]
+        for name in (*cls.model_fields, *cls.model_computed_fields)
+    }
+
+
+def write_json_file(path: Path, data: dict) -> None:
+    """Serialize and write `data` as indented JSON (blocking — run off-loop)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
 # ---------------------------------------------------------------------------
 # SSE helpers
 # ---------------------------------------------------------------------------
 
-def sse_event(event: str, data: dict) -> str:
-    """Format a Server-Sent Event."""
-    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+# Frames a pipeline may run ahead of a slow client before it waits
+EVENT_QUEUE_SIZE = 64
+
+
+def encode_sse_data(data: dict) -> bytes:
+    """Serialize an event payload as single-line JSON."""
+    try:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson stops at 64-bit ints; raw model output can carry longer
+        # unquoted IDs, which the stdlib encoder handles
+        return json.dumps(data, default=str, separators=(",", ":")).encode()
+
+
+def sse_frame(event: str, payload: bytes) -> bytes:
+    """Frame an already-encoded JSON payload as a Server-Sent Event."""
+    return b"event: " + event.encode() + b"\ndata: " + payload + b"\n\n"
+
+
+def sse_event(event: str, data: dict) -> bytes:
+    """Format a Server-Sent Event as ready-to-send bytes."""
+    return sse_frame(event, encode_sse_data(data))
+
+
+def sse_events(*events: tuple[str, dict]) -> bytes:
+    """Frame several (event, data) pairs into one chunk, preserving order.
+
+    Use for events emitted back-to-back so they go out in a single send().
+    """
+    return b"".join(sse_event(event, data) for event, data in events)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline steps
+# ---------------------------------------------------------------------------
+
+STEP_LOAD = "Load Document"
+STEP_CONVERT = "Convert to Images"
+STEP_EXTRACT = "Neural OCR Extraction"
+STEP_VALIDATE = "Validate Schema"
+STEP_VERIFY = "Verify Citations"
+STEP_PII = "PII Scan"
+STEP_OUTPUT = "Output"
+
+# Steps that only run in gov mode
+GOV_ONLY_STEPS = frozenset({STEP_PII})
+
+PIPELINE_STEPS = (
+    STEP_LOAD, STEP_CONVERT, STEP_EXTRACT, STEP_VALIDATE, STEP_VERIFY, STEP_PII, STEP_OUTPUT,
+)
+
+
+class StepEvents:
+    """Builds the step / step_complete event pairs for one extraction stream."""
+
+    def __init__(self, mode: str):
+        self.total = sum(1 for t in PIPELINE_STEPS if mode == "gov" or t not in GOV_ONLY_STEPS)
+        self.current = 0
+        self.title = ""
+
+    def start(self, title: str) -> tuple[str, dict]:
+        self.current += 1
+        self.title = title
+        return "step", {
+            "step": self.current, "total": self.total,
+            "title": title, "status": "running",
+        }
+
+    def complete(self, data: dict) -> tuple[str, dict]:
+        return "step_complete", {
+            "step": self.current, "title": self.title, "status": "complete",
+            "data": data,
+        }
+
+
+# ---------------------------------------------------------------------------
+# PDF metadata cache
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1024)
+def _pdf_info_for_version(pdf_path: str, mtime_ns: int, size: int) -> dict:
+    # mtime/size are only part of the key: a rewritten file misses the cache
+    return get_pdf_info(pdf_path)
+
+
+def cached_pdf_info(pdf_path: str) -> dict:
+    """get_pdf_info() memoized per file version — a hit costs one stat()."""
+    stat = Path(pdf_path).stat()
+    return _pdf_info_for_version(pdf_path, stat.st_mtime_ns, stat.st_size)
 
 
 # ---------------------------------------------------------------------------
@@ -71,17 +301,17 @@ def sse_event(event: str, data: dict) -> str:
 @app.get("/api/documents")
 async def list_documents() -> list[DocumentInfo]:
     """List available PDF documents in test_docs/."""
-    docs: list[DocumentInfo] = []
     if not TEST_DOCS_DIR.exists():
-        return docs
-    for pdf in sorted(TEST_DOCS_DIR.glob("*.pdf")):
-        info = get_pdf_info(str(pdf))
-        docs.append(DocumentInfo(
-            name=pdf.name,
-            size_human=info["size_human"],
-            pages=info["pages"],
-        ))
-    return docs
+        return []
+    pdfs = sorted(TEST_DOCS_DIR.glob("*.pdf"))
+    # Metadata reads shell out to pdfinfo — run them concurrently, off the loop
+    infos = await asyncio.gather(
+        *(run_in_thread(cached_pdf_info, str(pdf)) for pdf in pdfs)
+    )
+    return [
+        DocumentInfo(name=pdf.name, size_human=info["size_human"], pages=info["pages"])
+        for pdf, info in zip(pdfs, infos)
+    ]
 
 
 @app.get("/api/documents/{name}")
@@ -90,11 +320,11 @@ async def get_document(name: str):
     pdf_path = TEST_DOCS_DIR / name
     if not pdf_path.exists() or not pdf_path.suffix.lower() == ".pdf":
         raise HTTPException(status_code=404, detail="Document not found")
-    return FileResponse(
-        str(pdf_path),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"inline; filename={name}"},
-    )
+    headers = {"Content-Disposition": f"inline; filename={name}"}
+    if DOCS_ACCEL_REDIRECT_PREFIX:
+        headers["X-Accel-Redirect"] = DOCS_ACCEL_REDIRECT_PREFIX + quote(name)
+        return Response(media_type="application/pdf", headers=headers)
+    return FileResponse(str(pdf_path), media_type="application/pdf", headers=headers)
 
 
 @app.post("/api/extract")
@@ -103,7 +333,7 @@ async def extract(request: ExtractRequest):
     pdf_path = TEST_DOCS_DIR / request.filename
     if not pdf_path.exists():
         raise HTTPException(status_code=404, detail="Document not found")
-    if request.mode not in ("real_estate", "gov"):
+    if request.mode not in EXTRACTION_MODES:
         raise HTTPException(status_code=400, detail="Invalid mode")
 
     return StreamingResponse(
@@ -117,69 +347,73 @@ async def extract(request: ExtractRequest):
     )
 
 
-async def extraction_stream(mode: str, pdf_path: str) -> AsyncGenerator[str, None]:
-    """Generator that runs the pipeline and yields SSE events at each step."""
-    total_steps = 5  # Load, Convert, Extract, Validate, Output
-    total_steps += 1  # Verify citations
-    if mode == "gov":
-        total_steps += 1  # PII scan
+async def extraction_stream(mode: str, pdf_path: str) -> AsyncGenerator[bytes, None]:
+    """Yield the SSE frames run_pipeline produces, as soon as each is ready.
 
-    current_step = 0
+    The pipeline runs as its own task, so frames are flushed independently
+    of compute progress; it is cancelled if the client disconnects.
+    """
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    pipeline = asyncio.create_task(run_pipeline(mode, pdf_path, queue))
+    try:
+        done = False
+        while not done:
+            # Coalesce frames that queued up while the client was busy into one send()
+            frames = [await queue.get()]
+            while not queue.empty():
+                frames.append(queue.get_nowait())
+            if frames[-1] is None:
+                frames.pop()
+                done = True
+            if frames:
+                yield b"".join(frames)
+    finally:
+        pipeline.cancel()
+
+
+async def run_pipeline(mode: str, pdf_path: str, queue: asyncio.Queue) -> None:
+    """Run the extraction pipeline, putting SSE frames on `queue` at each step.
+
+    Finishes by putting None, after the complete or error event.
+    """
+    source = Path(pdf_path)
+    steps = StepEvents(mode)
+    images_task: asyncio.Task | None = None
+    page_texts_task: asyncio.Task | None = None
 
     try:
         # --- Step 1: Load Document ---
-        current_step += 1
-        yield sse_event("step", {
-            "step": current_step, "total": total_steps,
-            "title": "Load Document", "status": "running",
-        })
-        await asyncio.sleep(0.1)  # Let the event flush
+        await queue.put(sse_events(steps.start(STEP_LOAD)))
 
-        file_info = await asyncio.to_thread(get_pdf_info, pdf_path)
+        # Rasterizing doesn't depend on the metadata read — overlap the two
+        images_task = asyncio.create_task(run_in_process(
+            partial(pdf_to_base64_images, thread_count=PDF_RENDER_THREADS), pdf_path,
+        ))
+        file_info = await run_in_thread(cached_pdf_info, pdf_path)
 
-        yield sse_event("step_complete", {
-            "step": current_step, "title": "Load Document", "status": "complete",
-            "data": file_info,
-        })
+        await queue.put(sse_events(steps.complete(file_info)))
 
         # --- Step 2: Convert to Images ---
-        current_step += 1
-        yield sse_event("step", {
-            "step": current_step, "total": total_steps,
-            "title": "Convert to Images", "status": "running",
-        })
+        await queue.put(sse_events(steps.start(STEP_CONVERT)))
 
-        images = await asyncio.to_thread(pdf_to_images, pdf_path)
-        images_b64 = [image_to_base64(img) for img in images]
+        images_b64 = await images_task
+        # Data URIs for all three vision passes, built once for this run
+        page_content = await run_in_thread(page_image_content, images_b64)
 
-        yield sse_event("step_complete", {
-            "step": current_step, "title": "Convert to Images", "status": "complete",
-            "data": {"pages_converted": len(images)},
-        })
+        await queue.put(sse_events(steps.complete({"pages_converted": len(images_b64)})))
 
         # --- Step 3: Neural OCR Extraction ---
-        current_step += 1
-        yield sse_event("step", {
-            "step": current_step, "total": total_steps,
-            "title": "Neural OCR Extraction", "status": "running",
-        })
-
-        client = OpenAI()
-        raw_extraction = await asyncio.to_thread(
-            extract_from_images, images_b64, mode, client,
+        await queue.put(sse_events(steps.start(STEP_EXTRACT)))
+
+        client = get_openai_client()
+        raw_extraction = await run_ocr_call(
+            extract_from_images, images_b64, mode, client, page_content,
         )
 
-        yield sse_event("step_complete", {
-            "step": current_step, "title": "Neural OCR Extraction", "status": "complete",
-            "data": {"fields_extracted": len(raw_extraction)},
-        })
+        await queue.put(sse_events(steps.complete({"fields_extracted": len(raw_extraction)})))
 
         # --- Step 4: Validate Schema ---
-        current_step += 1
-        yield sse_event("step", {
-            "step": current_step, "total": total_steps,
-            "title": "Validate Schema", "status": "running",
-        })
+        await queue.put(sse_events(steps.start(STEP_VALIDATE)))
 
         validated = None
         validated_data = None
@@ -197,104 +431,119 @@ async def extraction_stream(mode: str, pdf_path: str) -> AsyncGenerator[str, Non
                 validation_errors.append(f"{loc}: {err['msg']}")
             validated_data = raw_extraction
 
-        yield sse_event("extraction", {"validated_data": validated_data})
-        yield sse_event("validation", {
-            "success": len(validation_errors) == 0,
-            "errors": validation_errors,
-        })
-        yield sse_event("step_complete", {
-            "step": current_step, "title": "Validate Schema", "status": "complete",
-            "data": {"success": len(validation_errors) == 0, "error_count": len(validation_errors)},
-        })
+        await queue.put(sse_events(
+            ("extraction", {"validated_data": validated_data}),
+            ("validation", {
+                "success": len(validation_errors) == 0,
+                "errors": validation_errors,
+            }),
+            steps.complete({
+                "success": len(validation_errors) == 0, "error_count": len(validation_errors),
+            }),
+        ))
+
+        # PII text extraction only needs the page images — run it alongside verification
+        if mode == "gov":
+            page_texts_task = asyncio.create_task(
+                run_ocr_call(extract_raw_text, images_b64, client, page_content)
+            )
 
         # --- Step 5: Verify Citations ---
-        current_step += 1
-        yield sse_event("step", {
-            "step": current_step, "total": total_steps,
-            "title": "Verify Citations", "status": "running",
-        })
-
-        citations = await asyncio.to_thread(
-            verify_extraction, images_b64, validated_data, client,
+        await queue.put(sse_events(steps.start(STEP_VERIFY)))
+
+        citations = await run_ocr_call(
+            verify_extraction, images_b64, validated_data, client, page_content,
         )
         overall_confidence = compute_overall_confidence(citations)
 
-        citations_data = [c.model_dump(mode="json") for c in citations]
+        citations_data = dump_citations(citations)
 
-        yield sse_event("citations", {
-            "citations": citations_data,
-            "overall_confidence": overall_confidence,
-        })
-        yield sse_event("step_complete", {
-            "step": current_step, "title": "Verify Citations", "status": "complete",
-            "data": {"citation_count": len(citations), "overall_confidence": overall_confidence},
-        })
+        await queue.put(sse_events(
+            ("citations", {
+                "citations": citations_data,
+                "overall_confidence": overall_confidence,
+            }),
+            steps.complete({
+                "citation_count": len(citations), "overall_confidence": overall_confidence,
+            }),
+        ))
 
         # --- Step 6: PII Scan (gov mode only) ---
         pii_report = None
+        pii_report_data = None
         if mode == "gov":
-            current_step += 1
-            yield sse_event("step", {
-                "step": current_step, "total": total_steps,
-                "title": "PII Scan", "status": "running",
-            })
-
-            page_texts = await asyncio.to_thread(
-                extract_raw_text, images_b64, client,
+            await queue.put(sse_events(steps.start(STEP_PII)))
+
+            page_texts = await page_texts_task
+            pii_report = await run_in_thread(scan_all_pages, page_texts)
+            pii_report_data = dump_with(
+                pii_report,
+                findings=_PII_FINDINGS_ADAPTER.dump_python(pii_report.findings, mode="json"),
             )
-            pii_report = scan_all_pages(page_texts)
-
-            yield sse_event("pii", {
-                "findings": [f.model_dump(mode="json") for f in pii_report.findings],
-                "risk_score": pii_report.pii_risk_score,
-                "risk_level": pii_report.risk_level.value,
-            })
-            yield sse_event("step_complete", {
-                "step": current_step, "title": "PII Scan", "status": "complete",
-                "data": {
+
+            await queue.put(sse_events(
+                ("pii", {
+                    "findings": pii_report_data["findings"],
+                    "risk_score": pii_report_data["pii_risk_score"],
+                    "risk_level": pii_report_data["risk_level"],
+                }),
+                steps.complete({
                     "finding_count": len(pii_report.findings),
                     "risk_score": pii_report.pii_risk_score,
-                },
-            })
+                }),
+            ))
 
         # --- Final Step: Output ---
-        current_step += 1
-        yield sse_event("step", {
-            "step": current_step, "total": total_steps,
-            "title": "Output", "status": "running",
-        })
+        await queue.put(sse_events(steps.start(STEP_OUTPUT)))
 
         dotloop_api_payload = None
         if mode == "real_estate" and validated and not validation_errors:
             dotloop_api_payload = validated.to_dotloop_api_format()
 
-        result = ExtractionResult(
+        result = ExtractionResult.build_trusted(
             mode=mode,
-            source_file=Path(pdf_path).name,
+            source_file=source.name,
             extraction_timestamp=datetime.now(timezone.utc).isoformat(),
-            pages_processed=len(images),
+            pages_processed=len(images_b64),
             dotloop_data=validated if mode == "real_estate" and not validation_errors else None,
             foia_data=validated if mode == "gov" and not validation_errors else None,
             dotloop_api_payload=dotloop_api_payload,
-            citations=citations,
+            citations=tuple(citations),
             overall_confidence=overall_confidence,
             pii_report=pii_report,
         )
 
-        # Write to dist/
-        output_path = DIST_DIR / f"{Path(pdf_path).stem}_extracted.json"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(result.model_dump_json(indent=2))
-
-        yield sse_event("step_complete", {
-            "step": current_step, "title": "Output", "status": "complete",
-            "data": {"output_path": str(output_path)},
-        })
+        # Serialize once — the same dict feeds dist/ and the complete event.
+        # Citations, the validated model and the PII report were already dumped
+        # for their own events; don't walk them again.
+        already_dumped = {"citations": citations_data}
+        if validated is not None and not validation_errors:
+            already_dumped["dotloop_data" if mode == "real_estate" else "foia_data"] = validated_data
+        if pii_report_data is not None:
+            already_dumped["pii_report"] = pii_report_data
+        complete_data = dump_with(result, **already_dumped)
+
+        # Write to dist/ and encode the complete event, both off the loop —
+        # they are the two largest serializations in the stream
+        output_path = DIST_DIR / f"{source.stem}_extracted.json"
+        complete_json, _ = await asyncio.gather(
+            run_in_thread(encode_sse_data, complete_data),
+            run_in_thread(write_json_file, output_path, complete_data),
+        )
 
-        yield sse_event("complete", result.model_dump(mode="json"))
+        await queue.put(
+            sse_events(steps.complete({"output_path": str(output_path)}))
+            + sse_frame("complete", complete_json)
+        )
 
     except Exception as e:
-        yield sse_event("error", {"message": str(e)})
+        await queue.put(sse_event("error", {"message": str(e)}))
+    finally:
+        for task in (images_task, page_texts_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+    await queue.put(None)
 
 
 # ---------------------------------------------------------------------------
@@ -303,4 +552,12 @@ async def extraction_stream(mode: str, pdf_path: str) -> AsyncGenerator[str, Non
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # An import string lets uvicorn spawn WORKERS processes; uvicorn[standard]
+    # picks uvloop and httptools automatically when they are installed
+    uvicorn.run(
+        "server:app",
+        app_dir=str(Path(__file__).parent),
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WORKERS", "1")),
+    )
@@ -1,6 +1,5 @@
 """Rich-based terminal UI for the DocExtract CLI demo."""
 
-import json
 from typing import Any
 
 from rich.console import Console
@@ -243,9 +242,8 @@ def show_pii_risk_score(score: int, level: str):
     )
 
 
-def show_json_output(data: dict, output_path: str):
-    """Pretty-print final JSON with syntax highlighting."""
-    json_str = json.dumps(data, indent=2, default=str)
+def show_json_output(json_str: str, output_path: str):
+    """Pretty-print already-serialized JSON with syntax highlighting."""
     # Truncate for display if very long
     lines = json_str.split("\n")
     if len(lines) > 60:
@@ -1,11 +1,18 @@
 """Verification pass — cites source locations for each extracted value."""
 
 import json
+from statistics import fmean
 
+import orjson
 from openai import OpenAI
+from pydantic import TypeAdapter, ValidationError
 
+from extractor import get_openai_client, page_image_content
 from schemas import VerificationCitation
 
+# Validates / dumps a whole citations array in one pydantic-core call
+_CITATIONS_ADAPTER = TypeAdapter(list[VerificationCitation])
+
 VERIFICATION_SYSTEM_PROMPT = """You are a document verification specialist. You previously extracted structured data from a document. Now you must VERIFY each extracted value by citing its exact source location in the document.
 
 For EACH field in the extraction result below, provide:
@@ -38,30 +45,40 @@ Rules:
 """
 
 
+def _format_extracted_data(extracted_data: dict) -> str:
+    """Pretty-print the extraction for the verification prompt."""
+    try:
+        return orjson.dumps(extracted_data, option=orjson.OPT_INDENT_2).decode()
+    except orjson.JSONEncodeError:
+        # orjson stops at 64-bit ints; the raw-extraction fallback can carry
+        # longer unquoted IDs, which the stdlib encoder handles
+        return json.dumps(extracted_data, indent=2, default=str)
+
+
 def verify_extraction(
     images_b64: list[str],
     extracted_data: dict,
-    client: OpenAI,
+    client: OpenAI | None = None,
+    page_content: tuple[dict, ...] | None = None,
 ) -> list[VerificationCitation]:
     """Second-pass verification: ask GPT-4o to cite source locations.
 
     Args:
         images_b64: List of base64-encoded page images.
         extracted_data: The previously extracted data dict.
-        client: OpenAI client instance.
+        client: OpenAI client instance. Defaults to the shared client.
+        page_content: Parts from page_image_content(images_b64), if the
+            caller already built them.
 
     Returns:
         List of VerificationCitation objects.
     """
-    content: list[dict] = []
+    client = client or get_openai_client()
 
-    # Include all page images
-    for i, img_b64 in enumerate(images_b64):
-        content.append({"type": "text", "text": f"--- Page {i + 1} of {len(images_b64)} ---"})
-        content.append({
-            "type": "image_url",
-            "image_url": {"url": f"data:image/png;base64,{img_b64}", "detail": "high"},
-        })
+    # Include all page images — the same parts the extraction pass sent
+    if page_content is None:
+        page_content = page_image_content(images_b64)
+    content = list(page_content)
 
     # Add the extraction to verify
     content.append({
@@ -69,7 +86,7 @@ def verify_extraction(
         "text": (
             "Here is the data that was extracted from the above document. "
             "Verify each field by citing its exact source location.\n\n"
-            f"Extracted data:\n{json.dumps(extracted_data, indent=2)}"
+            f"Extracted data:\n{_format_extracted_data(extracted_data)}"
         ),
     })
 
@@ -84,10 +101,15 @@ def verify_extraction(
         max_tokens=4096,
     )
 
-    raw = json.loads(response.choices[0].message.content)
+    raw = orjson.loads(response.choices[0].message.content)
 
-    # Parse into VerificationCitation objects
+    # Parse into VerificationCitation objects — bulk first, per-item if any are malformed
     citations_raw = raw.get("citations", [])
+    try:
+        return _CITATIONS_ADAPTER.validate_python(citations_raw)
+    except ValidationError:
+        pass
+
     citations: list[VerificationCitation] = []
     for c in citations_raw:
         try:
@@ -107,4 +129,9 @@ def compute_overall_confidence(citations: list[VerificationCitation]) -> float:
     """
     if not citations:
         return 0.0
-    return sum(c.confidence for c in citations) / len(citations)
+    return fmean(c.confidence for c in citations)
+
+
+def dump_citations(citations: list[VerificationCitation]) -> list[dict]:
+    """Dump citations to JSON-ready dicts in one serializer call."""
+    return _CITATIONS_ADAPTER.dump_python(citations, mode="json")